@@ -1,17 +1,21 @@
 import os
+import asyncio
+import httpx
+from contextlib import asynccontextmanager
 from fastapi import FastAPI, HTTPException, Query
-from typing import Optional
+from fastapi.responses import ORJSONResponse
+from typing import Optional, Dict, Any
 from dotenv import load_dotenv
 
 if os.path.exists('.dev.env'):
     load_dotenv('.dev.env')
 
 from z2k2 import twitter_client
-from z2k2.twitter_client import TwitterClient, TwitterAPIError, RateLimitError
+from z2k2.twitter_client import TwitterAPIError, RateLimitError, GRAPH_USER, GRAPH_USER_TWEETS
 from z2k2.twitter_parser import parse_user_from_graphql, parse_profile_from_graphql
 from z2k2.models import Profile, User
 from z2k2.session_manager import SessionManager
-from z2k2.postgres_cache import PostgresCache
+from z2k2.postgres_cache import PostgresCache, cached
 from z2k2.database import init_db
 
 
@@ -19,20 +23,59 @@ from z2k2.database import init_db
 cache_ttl = int(os.environ["CACHE_TTL_SECONDS"])
 cache_ttl_jitter = int(os.environ["CACHE_TTL_JITTER_SECONDS"])
 
-# Initialize database
-init_db()
-
 # Initialize cache for API responses
-twitter_client._cache = PostgresCache(cache_ttl, cache_ttl_jitter)
+cache = PostgresCache(cache_ttl, cache_ttl_jitter)
+twitter_client._cache = cache
+
+# Shared HTTP client for all Twitter API calls
+# Kept alive for the whole application so TCP/TLS connections are reused
+http_client = httpx.AsyncClient(
+    http2=True,
+    # Fail fast on connect and pool waits; only reading a response may take long
+    timeout=httpx.Timeout(connect=5.0, read=30.0, write=10.0, pool=5.0),
+    # httpx drops idle connections after 5s by default; keep them for a minute
+    # so requests arriving a few seconds apart still skip the TLS handshake
+    limits=httpx.Limits(max_connections=200, max_keepalive_connections=50, keepalive_expiry=60)
+)
 
 # Initialize session manager
 # Sessions will be rotated for each request
-session_manager = SessionManager("sessions.jsonl")
+sessions_file = os.getenv("Z2K2_SESSIONS_FILE", "sessions.jsonl")
+session_manager = SessionManager(sessions_file, http_client)
+
+
+async def clear_expired_cache_periodically():
+    """
+    Background task that removes expired cache entries.
+
+    Runs every tenth of the cache TTL so expired rows are cleaned up
+    outside of the request path.
+    """
+    while True:
+        await asyncio.sleep(max(cache_ttl // 10, 1))
+        try:
+            await cache.clear_expired()
+        except Exception as e:
+            print(f"Warning: Failed to clear expired cache entries: {e}")
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    await init_db()
+    await cache.open()
+    janitor = asyncio.create_task(clear_expired_cache_periodically())
+    yield
+    janitor.cancel()
+    await cache.close()
+    await http_client.aclose()
+
 
 app = FastAPI(
     title="z2k2",
     description="API server for selected social networks",
-    version="0.1.0"
+    version="0.1.0",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 
 
@@ -49,17 +92,9 @@ async def get_user_data(username: str) -> User:
     Raises:
         HTTPException: 404 if user not found
     """
-    session = session_manager.get_session()
-    client = TwitterClient(
-        oauth_token=session.oauth_token,
-        oauth_token_secret=session.oauth_token_secret
-    )
-
-    try:
-        user_response = await client.get_user_by_screen_name(username)
-        return parse_user_from_graphql(user_response)
-    finally:
-        await client.close()
+    client = session_manager.get_client(GRAPH_USER)
+    user_response = await client.get_user_by_screen_name(username)
+    return parse_user_from_graphql(user_response)
 
 
 @app.get("/")
@@ -85,23 +120,67 @@ async def get_user_tweets_data(user_id: str, cursor: Optional[str] = None):
     Returns:
         Parsed tweets response
     """
-    session = session_manager.get_session()
-    client = TwitterClient(
-        oauth_token=session.oauth_token,
-        oauth_token_secret=session.oauth_token_secret
-    )
+    client = session_manager.get_client(GRAPH_USER_TWEETS)
+    return await client.get_user_tweets(user_id, cursor)
 
-    try:
-        return await client.get_user_tweets(user_id, cursor)
-    finally:
-        await client.close()
+
+# Built profiles are cached in their serialized form, so hits skip fetching, parsing and validation
+# The raw timeline page isn't cached separately; the profile built from it replaces it
+@cached(lambda: cache, lambda username, cursor=None: f"app.get_profile_data.{username.lower()}.{cursor or 'first'}")
+async def get_profile_data(username: str, cursor: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Helper function to build the serialized profile and timeline of a user.
+
+    Args:
+        username: Twitter username (without @)
+        cursor: Optional pagination cursor
+
+    Returns:
+        Profile serialized as JSON-compatible dict
+
+    Raises:
+        HTTPException: 404 if user not found
+    """
+    # Username -> user ID mapping, so tweets can be fetched without waiting for the user lookup
+    user_id_key = f"app.get_profile_data.user_id.{username.lower()}"
+    cached_user_id = await cache.get(user_id_key)
+
+    user = None
+    tweets_response = None
+    if cached_user_id is not None:
+        # User ID is known: fetch user and tweets concurrently
+        # A failed tweets fetch only matters if the cached ID turns out to be current
+        user, tweets_response = await asyncio.gather(
+            get_user_data(username),
+            get_user_tweets_data(cached_user_id["user_id"], cursor),
+            return_exceptions=True
+        )
+        if isinstance(user, BaseException):
+            raise user
+    else:
+        user = await get_user_data(username)
+
+    if not user:
+        raise HTTPException(404, f'User @{username} is absent')
+
+    # Cold mapping, or the username now belongs to a different account
+    if cached_user_id is None or cached_user_id["user_id"] != user.id:
+        await cache.set(user_id_key, {"user_id": user.id})
+        tweets_response = await get_user_tweets_data(user.id, cursor)
+    elif isinstance(tweets_response, BaseException):
+        raise tweets_response
+
+    profile = parse_profile_from_graphql(tweets_response)
+    profile.user = user
+
+    return profile.model_dump(mode="json", by_alias=True)
 
 
-@app.get("/twitter/profile/{username}")
+@app.get("/twitter/profile/{username}", response_model=Profile)
 async def get_profile_timeline(
     username: str,
     cursor: Optional[str] = Query(None, description="Pagination cursor")
-) -> Profile:
+) -> ORJSONResponse:
     """
     Get user profile and timeline.
 
@@ -116,15 +195,7 @@ async def get_profile_timeline(
         HTTPException: On API errors or user not found
     """
     try:
-        user = await get_user_data(username)
-        if not user:
-            raise HTTPException(404, f'User @{username} is absent')
-
-        tweets_response = await get_user_tweets_data(user.id, cursor)
-        profile = parse_profile_from_graphql(tweets_response)
-        profile.user = user
-
-        return profile
+        return ORJSONResponse(await get_profile_data(username, cursor))
     except HTTPException:
         raise
     except RateLimitError:
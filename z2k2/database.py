@@ -1,66 +1,87 @@
 """
-Database connection and session management.
+Database connection and schema management.
+
+Cache queries go through an asyncpg pool. The schema is defined by the
+SQLAlchemy models in db_models, compiled to plain DDL and applied with
+asyncpg at startup.
 """
 import os
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker, Session
-from contextlib import contextmanager
+import asyncpg
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.schema import CreateTable, CreateIndex
 
 # Database URL - required environment variable
 DATABASE_URL = os.getenv("DATABASE_URL")
 if not DATABASE_URL:
     raise ValueError("DATABASE_URL environment variable is required")
 
-# Create engine
-engine = create_engine(DATABASE_URL)
+# Advisory lock serializing schema setup across workers starting at the same time
+_SCHEMA_LOCK_ID = 0x7A326B32
 
-# Create session factory
-SessionLocal = sessionmaker(bind=engine)
+# True when the current cache schema (table with expires_at and a valid index on it) is in place
+_SCHEMA_READY_SQL = (
+    "SELECT EXISTS ("
+    "SELECT 1 FROM pg_index WHERE indexrelid = to_regclass('idx_cache_expires_at') AND indisvalid"
+    ") AND EXISTS ("
+    "SELECT 1 FROM information_schema.columns "
+    "WHERE table_name = 'cache' AND column_name = 'expires_at')"
+)
 
 
-def get_db() -> Session:
+async def _create_pool() -> asyncpg.Pool:
     """
-    Dependency function for FastAPI to get database session.
+    Create the asyncpg connection pool used for cache queries.
+
+    Commits on these connections don't wait for the WAL flush. A crash can
+    lose the last few cache writes, which are simply refetched, but never
+    corrupts the table.
 
-    Usage:
-        @app.get("/endpoint")
-        def endpoint(db: Session = Depends(get_db)):
-            # Use db session
-            pass
+    Returns:
+        Connection pool for DATABASE_URL
     """
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
+    return await asyncpg.create_pool(
+        DATABASE_URL,
+        min_size=5,
+        max_size=20,
+        server_settings={"synchronous_commit": "off"},
+    )
 
 
-@contextmanager
-def get_db_context():
+async def init_db():
     """
-    Context manager for database session.
+    Initialize the database by creating missing tables and indexes.
 
-    Usage:
-        with get_db_context() as db:
-            # Use db session
-            pass
+    Checks the schema with a single catalog query and only runs DDL when
+    something is missing, so worker startup normally costs one round-trip.
     """
-    db = SessionLocal()
-    try:
-        yield db
-        db.commit()
-    except Exception:
-        db.rollback()
-        raise
-    finally:
-        db.close()
+    from z2k2.db_models import Cache
 
+    dialect = postgresql.dialect()
+    conn = await asyncpg.connect(DATABASE_URL)
+    try:
+        if await conn.fetchval(_SCHEMA_READY_SQL):
+            return
 
-def init_db():
-    """
-    Initialize the database by creating all tables.
-    """
-    from z2k2.db_models import Base
+        await conn.execute("SELECT pg_advisory_lock($1)", _SCHEMA_LOCK_ID)
+        try:
+            # Cache tables from older versions (without expires_at) are
+            # dropped and recreated; their entries are simply refetched
+            # An invalid index left by an earlier failed build is dropped so it gets rebuilt
+            await conn.execute(
+                "DO $$ BEGIN "
+                "IF to_regclass('cache') IS NOT NULL AND NOT EXISTS ("
+                "SELECT 1 FROM information_schema.columns "
+                "WHERE table_name = 'cache' AND column_name = 'expires_at') "
+                "THEN DROP TABLE cache; END IF; "
+                "IF EXISTS ("
+                "SELECT 1 FROM pg_index WHERE indexrelid = to_regclass('idx_cache_expires_at') AND NOT indisvalid) "
+                "THEN DROP INDEX idx_cache_expires_at; END IF; END $$"
+            )
 
-    # Create all tables
-    Base.metadata.create_all(bind=engine)
+            await conn.execute(str(CreateTable(Cache.__table__, if_not_exists=True).compile(dialect=dialect)))
+            for index in Cache.__table__.indexes:
+                await conn.execute(str(CreateIndex(index, if_not_exists=True).compile(dialect=dialect)))
+        finally:
+            await conn.execute("SELECT pg_advisory_unlock($1)", _SCHEMA_LOCK_ID)
+    finally:
+        await conn.close()
@@ -2,7 +2,7 @@
 Database models for z2k2.
 """
 
-from sqlalchemy import Column, String, Integer, Text
+from sqlalchemy import Column, String, Integer, BigInteger, LargeBinary, Index
 from sqlalchemy.ext.declarative import declarative_base
 
 Base = declarative_base()
@@ -12,10 +12,21 @@ class Cache(Base):
     """
     Cache model for storing API responses with TTL.
 
-    Stores key-value pairs with timestamps for automatic expiration.
+    Stores key-value pairs with an expiration time (unix seconds, TTL and
+    jitter already applied) for automatic expiration.
+    Values are orjson-serialized bytes.
+
+    Rows are keyed by a 64-bit hash of the key to keep the primary key
+    index small; the full key is stored alongside to rule out collisions.
     """
     __tablename__ = "cache"
 
-    key = Column(String, primary_key=True)
-    value = Column(Text, nullable=False)
-    timestamp = Column(Integer, nullable=False)
+    key_hash = Column(BigInteger, primary_key=True, autoincrement=False)
+    key = Column(String, nullable=False)
+    value = Column(LargeBinary, nullable=False)
+    expires_at = Column(Integer, nullable=False)
+
+    # Lets clear_expired delete by expiration range without a full scan
+    # Built in the same step as the table, so a plain (non-concurrent) build is fine
+    # and can run under the schema advisory lock
+    __table_args__ = (Index("idx_cache_expires_at", "expires_at"),)
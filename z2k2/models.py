@@ -6,7 +6,7 @@ Ported from nitter (Nim) to Python.
 from datetime import datetime
 from enum import Enum
 from typing import Optional, List
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class VerifiedType(str, Enum):
@@ -74,8 +74,7 @@ class User(BaseModel):
     suspended: bool = False
     join_date: datetime = Field(alias="joinDate")
 
-    class Config:
-        populate_by_name = True
+    model_config = ConfigDict(populate_by_name=True, extra="ignore")
 
 
 class VideoVariant(BaseModel):
@@ -85,8 +84,7 @@ class VideoVariant(BaseModel):
     bitrate: int = 0
     resolution: int = 0
 
-    class Config:
-        populate_by_name = True
+    model_config = ConfigDict(populate_by_name=True, extra="ignore", frozen=True)
 
 
 class Video(BaseModel):
@@ -102,8 +100,7 @@ class Video(BaseModel):
     playback_type: VideoType = Field(default=VideoType.MP4, alias="playbackType")
     variants: List[VideoVariant] = Field(default_factory=list)
 
-    class Config:
-        populate_by_name = True
+    model_config = ConfigDict(populate_by_name=True, extra="ignore")
 
 
 class Gif(BaseModel):
@@ -111,6 +108,8 @@ class Gif(BaseModel):
     url: str
     thumb: str
 
+    model_config = ConfigDict(frozen=True)
+
 
 class Card(BaseModel):
     """Tweet card (link preview)."""
@@ -139,6 +138,8 @@ class TweetStats(BaseModel):
     likes: int = 0
     quotes: int = 0
 
+    model_config = ConfigDict(frozen=True)
+
 
 class Tweet(BaseModel):
     """Twitter tweet/post."""
@@ -167,8 +168,7 @@ class Tweet(BaseModel):
     photos: List[str] = Field(default_factory=list)
     videos: List[Video] = Field(default_factory=list)
 
-    class Config:
-        populate_by_name = True
+    model_config = ConfigDict(populate_by_name=True, extra="ignore")
 
 
 class Timeline(BaseModel):
@@ -196,8 +196,7 @@ class TwitterList(BaseModel):
     members: int = 0
     banner: str = ""
 
-    class Config:
-        populate_by_name = True
+    model_config = ConfigDict(populate_by_name=True, extra="ignore")
 
 
 class Url(BaseModel):
@@ -207,8 +206,7 @@ class Url(BaseModel):
     display_url: str = Field(alias="displayUrl")
     indices: List[int] = Field(default_factory=lambda: [0, 0])
 
-    class Config:
-        populate_by_name = True
+    model_config = ConfigDict(populate_by_name=True, extra="ignore")
 
 
 # Update forward references
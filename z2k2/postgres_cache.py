@@ -2,21 +2,80 @@
 Generic PostgreSQL-based cache with TTL support.
 """
 
-import json
+import asyncio
+import hashlib
+import inspect
+import orjson
 import time
 import random
-from typing import Optional, Dict, Any, Callable
+import asyncpg
+from collections import OrderedDict
+from typing import Optional, Dict, Any, Callable, Tuple
 from functools import wraps
-from z2k2.database import get_db_context
-from z2k2.db_models import Cache
+from z2k2.database import _create_pool
+
+# Budget of the in-process (L1) cache, measured in serialized JSON bytes
+# Decoded values take several times that in memory, so this is an approximate bound
+_L1_MAX_BYTES = 32 * 1024 * 1024
+# Larger values are only kept in Postgres
+_L1_MAX_ENTRY_BYTES = 256 * 1024
+
+# Buffered writes are flushed to Postgres once this many are pending,
+# or this many seconds after the first one was buffered
+_FLUSH_THRESHOLD = 32
+_FLUSH_INTERVAL = 1.0
+
+# Cache queries
+# asyncpg prepares each distinct statement once per connection and reuses it
+# from its statement cache, so these must stay fixed strings with $n parameters
+# Rows are looked up by key hash, with the full key as a collision tiebreaker
+_SELECT_SQL = "SELECT value, expires_at FROM cache WHERE key_hash = $1 AND key = $2 AND expires_at > $3"
+_UPSERT_SQL = (
+    "INSERT INTO cache (key_hash, key, value, expires_at) VALUES ($1, $2, $3, $4) "
+    "ON CONFLICT (key_hash) DO UPDATE "
+    "SET key = EXCLUDED.key, value = EXCLUDED.value, expires_at = EXCLUDED.expires_at"
+)
+_DELETE_SQL = "DELETE FROM cache WHERE key_hash = $1 AND key = $2"
+_DELETE_EXPIRED_SQL = "DELETE FROM cache WHERE expires_at <= $1"
+
+
+def _hash_key(key: str) -> int:
+    """
+    Hash a cache key to a signed 64-bit integer (Postgres BIGINT).
+
+    Args:
+        key: Cache key
+
+    Returns:
+        Key hash
+    """
+    digest = hashlib.blake2b(key.encode(), digest_size=8).digest()
+    return int.from_bytes(digest, "big", signed=True)
 
 
 class PostgresCache:
     """
     Generic PostgreSQL-based cache with automatic expiration.
 
-    Stores key-value pairs with timestamps and automatically
-    expires entries older than the specified TTL.
+    Stores key-value pairs with an expiration time and automatically
+    expires entries older than the specified TTL. The jittered TTL is
+    fixed when an entry is written, so every read sees the same expiry.
+
+    Queries go through an asyncpg connection pool so cache lookups
+    don't block the event loop. The pool is created by open() and
+    released by close().
+
+    Hot keys are also kept in a small in-process LRU (L1) in front of
+    Postgres (L2). L1 entries live at most half the TTL, which bounds how
+    stale one worker's view can get relative to the others. The L1 is
+    bounded by the serialized size of its values, and oversized values
+    skip it entirely. Values returned from L1 are shared, so callers must
+    not mutate them.
+
+    Writes are buffered in memory and upserted in batches (write-behind),
+    so a burst of fetches costs one round-trip instead of one per entry.
+    Other workers see a new entry once its batch is flushed, at most
+    about a second later. close() flushes whatever is still pending.
     """
 
     def __init__(self, ttl: int, ttl_jitter: int):
@@ -30,11 +89,36 @@ class PostgresCache:
         """
         self.ttl = ttl
         self.ttl_jitter = ttl_jitter
+        self._pool: Optional[asyncpg.Pool] = None
+        # key -> (expires_at, value, serialized size)
+        self._l1: OrderedDict[str, Tuple[int, Dict[str, Any], int]] = OrderedDict()
+        self._l1_bytes = 0
+        # key -> task fetching the value on a miss, shared by concurrent callers
+        self._inflight: Dict[str, asyncio.Task] = {}
+        # key -> (expires_at, value, serialized value) written but not yet flushed to Postgres
+        self._pending: Dict[str, Tuple[int, Dict[str, Any], bytes]] = {}
+        self._flush_task: Optional[asyncio.Task] = None
+
+    async def open(self):
+        """Create the connection pool. Must be called before using the cache."""
+        self._pool = await _create_pool()
+
+    async def close(self):
+        """Flush pending writes and close the connection pool."""
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            self._flush_task = None
+        if self._pool is not None:
+            await self._try_flush()
+            await self._pool.close()
+            self._pool = None
 
     def _get_effective_ttl(self) -> int:
         """
         Get TTL with randomized jitter to prevent cache stampede.
 
+        Rolled once per write, so entries written together expire at different times.
+
         Returns:
             Effective TTL with random jitter applied
         """
@@ -46,104 +130,188 @@ class PostgresCache:
         # Result will be between 3240 and 3960 seconds
         return int(self.ttl + random.uniform(-self.ttl_jitter, self.ttl_jitter))
 
-    def get(self, key: str) -> Optional[Dict[str, Any]]:
+    def _l1_get(self, key: str, current_time: int) -> Optional[Dict[str, Any]]:
         """
-        Get cached value if not expired.
+        Get value from the in-process cache if present and fresh.
 
         Args:
             key: Cache key
+            current_time: Current unix time
 
         Returns:
             Cached value or None if not found/expired
         """
-        with get_db_context() as db:
-            cache_entry = db.query(Cache).filter(Cache.key == key).first()
+        entry = self._l1.get(key)
+        if entry is None:
+            return None
 
-            if cache_entry is None:
-                return None
+        expires_at, value, size = entry
+        if expires_at <= current_time:
+            del self._l1[key]
+            self._l1_bytes -= size
+            return None
 
-            current_time = int(time.time())
+        self._l1.move_to_end(key)
+        return value
 
-            # Check if cache entry is expired using randomized TTL
-            effective_ttl = self._get_effective_ttl()
-            if current_time - cache_entry.timestamp > effective_ttl:
-                # Delete expired entry
-                db.delete(cache_entry)
-                db.commit()
-                return None
+    def _l1_set(self, key: str, value: Dict[str, Any], size: int, expires_at: int):
+        """
+        Store value in the in-process cache, evicting least recently used entries if full.
 
-            return json.loads(cache_entry.value)
+        Args:
+            key: Cache key
+            value: Value to cache
+            size: Size of the value serialized as JSON, in bytes
+            expires_at: Unix time after which the entry is stale
+        """
+        self._l1_delete(key)
+        if size > _L1_MAX_ENTRY_BYTES:
+            return
+
+        self._l1[key] = (expires_at, value, size)
+        self._l1_bytes += size
+        while self._l1_bytes > _L1_MAX_BYTES:
+            _, (_, _, evicted_size) = self._l1.popitem(last=False)
+            self._l1_bytes -= evicted_size
 
-    def set(self, key: str, value: Dict[str, Any]):
+    def _l1_delete(self, key: str):
         """
-        Set cache value with current timestamp.
+        Remove value from the in-process cache if present.
+
+        Args:
+            key: Cache key
+        """
+        entry = self._l1.pop(key, None)
+        if entry is not None:
+            self._l1_bytes -= entry[2]
+
+    async def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Get cached value if not expired.
 
         Args:
             key: Cache key
-            value: Value to cache (will be JSON serialized)
+
+        Returns:
+            Cached value or None if not found/expired
         """
-        with get_db_context() as db:
-            timestamp = int(time.time())
-            value_json = json.dumps(value)
+        current_time = int(time.time())
+
+        value = self._l1_get(key, current_time)
+        if value is not None:
+            return value
+
+        pending = self._pending.get(key)
+        if pending is not None and pending[0] > current_time:
+            return pending[1]
 
-            # Check if entry exists
-            cache_entry = db.query(Cache).filter(Cache.key == key).first()
+        # Expired rows are filtered out here and left for clear_expired to remove,
+        # keeping reads write-free
+        async with self._pool.acquire() as conn:
+            row = await conn.fetchrow(_SELECT_SQL, _hash_key(key), key, current_time)
 
-            if cache_entry:
-                # Update existing entry
-                cache_entry.value = value_json
-                cache_entry.timestamp = timestamp
-            else:
-                # Create new entry
-                cache_entry = Cache(
-                    key=key,
-                    value=value_json,
-                    timestamp=timestamp
-                )
-                db.add(cache_entry)
+        if row is None:
+            return None
 
-            db.commit()
+        data = row["value"]
+        value = orjson.loads(data)
+        self._l1_set(key, value, len(data), min(row["expires_at"], current_time + self.ttl // 2))
+        return value
 
-    def delete(self, key: str):
+    async def set(self, key: str, value: Dict[str, Any]):
+        """
+        Set cache value, expiring after the TTL (with jitter).
+
+        The value is buffered and written to Postgres with the next flush.
+
+        Args:
+            key: Cache key
+            value: Value to cache (will be JSON serialized with orjson)
+        """
+        current_time = int(time.time())
+        expires_at = current_time + self._get_effective_ttl()
+
+        # Serialized once here; the size bounds the L1 and the bytes are written by the flush
+        data = orjson.dumps(value)
+        self._pending[key] = (expires_at, value, data)
+        self._l1_set(key, value, len(data), min(expires_at, current_time + self.ttl // 2))
+
+        if len(self._pending) >= _FLUSH_THRESHOLD:
+            await self._try_flush()
+        elif self._flush_task is None:
+            self._flush_task = asyncio.create_task(self._flush_later())
+
+    async def _flush(self):
+        """Write all buffered entries to Postgres in a single batch."""
+        if not self._pending:
+            return
+
+        pending, self._pending = self._pending, {}
+        rows = [
+            (_hash_key(key), key, data, expires_at)
+            for key, (expires_at, _, data) in pending.items()
+        ]
+        async with self._pool.acquire() as conn:
+            await conn.executemany(_UPSERT_SQL, rows)
+
+    async def _try_flush(self):
+        """
+        Flush buffered entries, logging failures instead of raising.
+
+        A failed cache write must not fail the request that produced the value;
+        the dropped entries are simply refetched later.
+        """
+        try:
+            await self._flush()
+        except Exception as e:
+            print(f"Warning: Failed to flush cache writes: {e}")
+
+    async def _flush_later(self):
+        """Flush buffered entries once the flush interval has passed."""
+        await asyncio.sleep(_FLUSH_INTERVAL)
+        self._flush_task = None
+        await self._try_flush()
+
+    async def delete(self, key: str):
         """
         Delete a specific cache entry.
 
         Args:
             key: Cache key to delete
         """
-        with get_db_context() as db:
-            cache_entry = db.query(Cache).filter(Cache.key == key).first()
-            if cache_entry:
-                db.delete(cache_entry)
-                db.commit()
+        self._l1_delete(key)
+        self._pending.pop(key, None)
+        async with self._pool.acquire() as conn:
+            await conn.execute(_DELETE_SQL, _hash_key(key), key)
 
-    def clear_expired(self):
+    async def clear_expired(self):
         """
         Clear all expired cache entries.
 
-        Uses maximum TTL (with positive jitter) to ensure we only delete
-        entries that are guaranteed to be expired.
+        Deletes by the indexed expires_at column, so this is a range scan
+        rather than a full table scan.
         """
-        with get_db_context() as db:
-            current_time = int(time.time())
-            # Use maximum possible TTL to avoid deleting entries that might still be valid
-            max_ttl = self.ttl + self.ttl_jitter
-            db.query(Cache).filter(
-                current_time - Cache.timestamp > max_ttl
-            ).delete(synchronize_session=False)
-            db.commit()
+        current_time = int(time.time())
+        async with self._pool.acquire() as conn:
+            await conn.execute(_DELETE_EXPIRED_SQL, current_time)
 
-    def clear_all(self):
+    async def clear_all(self):
         """Clear all cache entries."""
-        with get_db_context() as db:
-            db.query(Cache).delete(synchronize_session=False)
-            db.commit()
+        self._l1.clear()
+        self._l1_bytes = 0
+        self._pending.clear()
+        async with self._pool.acquire() as conn:
+            await conn.execute("DELETE FROM cache")
 
 
 def cached(cache_getter: Callable[[], PostgresCache], key_fn: Callable):
     """
     Decorator to cache async method results.
 
+    Concurrent misses for the same key are collapsed into a single call of
+    the decorated function; the other callers await its result instead of
+    hitting the upstream API themselves.
+
     Args:
         cache_getter: Callable that returns the PostgresCache instance (evaluated at runtime)
         key_fn: Function that takes method args/kwargs and returns cache key
@@ -156,27 +324,44 @@ def cached(cache_getter: Callable[[], PostgresCache], key_fn: Callable):
             return await fetch_user(username)
     """
     def decorator(func):
+        # Skip the 'self'/'cls' argument when building keys for methods;
+        # decided once here rather than on every call
+        params = list(inspect.signature(func).parameters)
+        skip = 1 if params and params[0] in ("self", "cls") else 0
+
         @wraps(func)
         async def wrapper(*args, **kwargs):
             # Get cache instance at runtime (not decoration time)
             cache_instance = cache_getter()
 
             # Generate cache key
-            # Skip 'self' argument if it's a method
-            func_args = args[1:] if args and hasattr(args[0], func.__name__) else args
-            key = key_fn(*func_args, **kwargs)
+            key = key_fn(*args[skip:], **kwargs)
+
+            task = cache_instance._inflight.get(key)
+            if task is None:
+                # Try to get from cache
+                cached_value = await cache_instance.get(key)
+                if cached_value is not None:
+                    return cached_value
+
+                # Another caller may have started fetching while we were reading
+                task = cache_instance._inflight.get(key)
+
+            if task is None:
+                async def fetch_and_store():
+                    # Call original function
+                    result = await func(*args, **kwargs)
 
-            # Try to get from cache
-            cached_value = cache_instance.get(key)
-            if cached_value is not None:
-                return cached_value
+                    # Store in cache
+                    await cache_instance.set(key, result)
 
-            # Call original function
-            result = await func(*args, **kwargs)
+                    return result
 
-            # Store in cache
-            cache_instance.set(key, result)
+                task = asyncio.create_task(fetch_and_store())
+                cache_instance._inflight[key] = task
+                task.add_done_callback(lambda _: cache_instance._inflight.pop(key, None))
 
-            return result
+            # Shield so a cancelled caller doesn't cancel the fetch for everyone else
+            return await asyncio.shield(task)
         return wrapper
     return decorator
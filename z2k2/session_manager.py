@@ -3,13 +3,20 @@ Session manager for Twitter OAuth credentials.
 Reads and manages sessions from sessions.jsonl file.
 """
 
-import json
+import os
+import orjson
+import itertools
+import httpx
 from pathlib import Path
 from typing import List
 from dataclasses import dataclass
+from z2k2.twitter_client import TwitterClient
 
+# Directory containing the z2k2 package, where sessions.jsonl normally lives
+_REPO_ROOT = Path(__file__).resolve().parent.parent
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class _TwitterSession:
     """Twitter OAuth session credentials."""
     oauth_token: str
@@ -22,18 +29,33 @@ class SessionManager:
 
     Loads sessions from a JSONL file (one JSON object per line) where each
     session contains oauth_token and oauth_token_secret.
+
+    One long-lived TwitterClient is created per session, all sharing the
+    same HTTP client so connections are reused across requests.
     """
 
-    def __init__(self, sessions_file: str):
+    def __init__(self, sessions_file: str, http_client: httpx.AsyncClient):
         """
         Initialize session manager.
 
         Args:
-            sessions_file: Path to sessions JSONL file (relative to repo root)
+            sessions_file: Path to sessions JSONL file (relative paths are looked up
+                           in the current directory, then the repo root)
+            http_client: Shared HTTP client used by every session's TwitterClient
         """
         self.sessions: List[_TwitterSession] = []
-        self._current_index = 0
+        # Start each worker process at a different session so workers don't
+        # all hammer the same token first; next() on a count is atomic under the GIL
+        self._counter = itertools.count(os.getpid())
         self._load_sessions(sessions_file)
+        self._clients: List[TwitterClient] = [
+            TwitterClient(
+                oauth_token=session.oauth_token,
+                oauth_token_secret=session.oauth_token_secret,
+                http_client=http_client
+            )
+            for session in self.sessions
+        ]
 
     def _load_sessions(self, sessions_file: str):
         """
@@ -42,19 +64,11 @@ class SessionManager:
         Args:
             sessions_file: Path to sessions file
         """
-        # Find repo root (where sessions.jsonl is located)
         sessions_path = Path(sessions_file)
 
-        # If relative path, resolve from current working directory
-        if not sessions_path.is_absolute():
-            # Try current directory first
-            if not sessions_path.exists():
-                # Try parent directories (up to 3 levels)
-                for parent in [Path.cwd()] + list(Path.cwd().parents)[:3]:
-                    potential_path = parent / sessions_file
-                    if potential_path.exists():
-                        sessions_path = potential_path
-                        break
+        # If relative path and not in the current directory, fall back to the repo root
+        if not sessions_path.is_absolute() and not sessions_path.exists():
+            sessions_path = _REPO_ROOT / sessions_file
 
         if not sessions_path.exists():
             raise FileNotFoundError(
@@ -63,20 +77,21 @@ class SessionManager:
             )
 
         # Read JSONL file (one JSON object per line)
-        with open(sessions_path, 'r') as f:
+        # Opened in binary mode since orjson parses bytes directly
+        with open(sessions_path, 'rb') as f:
             for line_num, line in enumerate(f, 1):
                 line = line.strip()
                 if not line:
                     continue
 
                 try:
-                    session_data = json.loads(line)
+                    session_data = orjson.loads(line)
                     session = _TwitterSession(
                         oauth_token=session_data["oauth_token"],
                         oauth_token_secret=session_data["oauth_token_secret"]
                     )
                     self.sessions.append(session)
-                except (json.JSONDecodeError, KeyError) as e:
+                except (orjson.JSONDecodeError, KeyError) as e:
                     print(f"Warning: Invalid session on line {line_num}: {e}")
                     continue
 
@@ -88,16 +103,28 @@ class SessionManager:
 
         print(f"Loaded {len(self.sessions)} session(s) from {sessions_path}")
 
-    def get_session(self) -> _TwitterSession:
+    def get_client(self, endpoint: str) -> TwitterClient:
         """
-        Get next session using round-robin strategy.
+        Get the TwitterClient of the next session using round-robin strategy.
+
+        Sessions whose rate limit for the endpoint is used up are skipped, so
+        requests only fail locally once every session is exhausted.
+
+        Args:
+            endpoint: GraphQL endpoint URL the client will be used for
 
         Returns:
-            _TwitterSession with oauth credentials
+            TwitterClient bound to the session's oauth credentials
         """
-        if not self.sessions:
+        if not self._clients:
             raise RuntimeError("No sessions available")
 
-        session = self.sessions[self._current_index]
-        self._current_index = (self._current_index + 1) % len(self.sessions)
-        return session
+        count = len(self._clients)
+        start = next(self._counter) % count
+        for offset in range(count):
+            client = self._clients[(start + offset) % count]
+            if client._has_capacity(endpoint):
+                return client
+
+        # Every session is rate limited; the round-robin pick reports it
+        return self._clients[start]
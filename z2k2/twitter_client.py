@@ -3,10 +3,10 @@ Twitter GraphQL API client.
 Ported from nitter to Python.
 """
 
+import time
 import httpx
-import json
+import orjson
 from typing import Optional, Dict, Any
-from urllib.parse import urlencode
 from authlib.integrations.httpx_client import OAuth1Auth
 from z2k2.postgres_cache import PostgresCache, cached
 
@@ -17,8 +17,16 @@ _CONSUMER_SECRET = "Bcs59EFbbsdF6Sl9Ng71smgStWEGwXXKSjYvPVt7qys"
 # GraphQL endpoints
 _GRAPHQL_BASE = "https://api.x.com/graphql"
 
-_GRAPH_USER = f"{_GRAPHQL_BASE}/u7wQyGi6oExe8_TRWGMq4Q/UserResultByScreenNameQuery"
-_GRAPH_USER_TWEETS = f"{_GRAPHQL_BASE}/JLApJKFY0MxGTzCoK6ps8Q/UserWithProfileTweetsQueryV2"
+GRAPH_USER = f"{_GRAPHQL_BASE}/u7wQyGi6oExe8_TRWGMq4Q/UserResultByScreenNameQuery"
+GRAPH_USER_TWEETS = f"{_GRAPHQL_BASE}/JLApJKFY0MxGTzCoK6ps8Q/UserWithProfileTweetsQueryV2"
+
+# Requests assumed per session and endpoint in each rate limit window, until the
+# server reports the actual limit in x-rate-limit-limit
+_RATE_LIMIT_WINDOW = 15 * 60
+_RATE_LIMITS = {
+    GRAPH_USER: 500,
+    GRAPH_USER_TWEETS: 150,
+}
 
 # GraphQL features (enable/disable various Twitter API features)
 _GQL_FEATURES = {
@@ -80,6 +88,34 @@ _GQL_FEATURES = {
     "responsive_web_grok_analysis_button_from_backend": False
 }
 
+# The features never change, so they are serialized once instead of per request
+_GQL_FEATURES_JSON = orjson.dumps(_GQL_FEATURES).decode()
+
+# Variables sent with every user tweets request (rest_id and cursor are added per call)
+_USER_TWEETS_VARIABLES = {
+    "count": 20,
+    "includePromotedContent": False,
+    "withDownvotePerspective": False,
+    "withReactionsMetadata": False,
+    "withReactionsPerspective": False,
+    "withVoice": False,
+    "withV2Timeline": True
+}
+
+# Request headers for Twitter API, the same for every request
+# Based on nitter's implementation from apiutils.nim.
+# Note: OAuth 1.0 authorization header is added automatically by OAuth1Auth.
+_HEADERS = {
+    "authority": "api.x.com",
+    "content-type": "application/json",
+    "x-twitter-active-user": "yes",
+    "accept": "*/*",
+    "accept-encoding": "br, gzip",
+    "accept-language": "en-US,en;q=0.9",
+    "connection": "keep-alive",
+    "DNT": "1",
+}
+
 # Module-level cache instance (set from app.py)
 # This will be assigned during app initialization
 # Note: We use lambda in @cached decorator (e.g., @cached(lambda: _cache, ...))
@@ -100,21 +136,114 @@ class RateLimitError(TwitterAPIError):
     pass
 
 
+class _TokenBucket:
+    """
+    Client-side rate limit for one endpoint of one session.
+
+    Holds up to capacity tokens and refills continuously so that a full
+    bucket's worth is restored over each window.
+    """
+    __slots__ = ("capacity", "window", "rate", "tokens", "updated_at")
+
+    def __init__(self, capacity: int, window: float):
+        """
+        Initialize a full bucket.
+
+        Args:
+            capacity: Maximum number of requests per window
+            window: Window length in seconds
+        """
+        self.capacity = capacity
+        self.window = window
+        self.rate = capacity / window
+        self.tokens = float(capacity)
+        self.updated_at = time.monotonic()
+
+    def try_acquire(self) -> bool:
+        """
+        Take one token if available.
+
+        Returns:
+            True if the request may be sent, False if the bucket is empty
+        """
+        now = time.monotonic()
+        # Refill is paused until the server's window resets (see sync)
+        if now < self.updated_at:
+            return False
+
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+        self.updated_at = now
+
+        if self.tokens < 1:
+            return False
+        self.tokens -= 1
+        return True
+
+    def has_token(self) -> bool:
+        """
+        Check whether a token is available, without taking it.
+
+        Returns:
+            True if try_acquire would currently succeed
+        """
+        now = time.monotonic()
+        if now < self.updated_at:
+            return False
+        return self.tokens + (now - self.updated_at) * self.rate >= 1
+
+    def drain(self):
+        """Empty the bucket, e.g. after the server reported a rate limit."""
+        self.tokens = 0.0
+        self.updated_at = time.monotonic()
+
+    def sync(self, limit: Optional[int], remaining: int, reset_in: float):
+        """
+        Match the server's count from its rate limit response headers.
+
+        Args:
+            limit: Requests allowed per window, or None if the server didn't report it
+            remaining: Requests left in the server's current window
+            reset_in: Seconds until the server's window resets
+        """
+        if limit:
+            # The server's limit for this session replaces the assumed default
+            self.capacity = limit
+            self.rate = limit / self.window
+
+        now = time.monotonic()
+        if remaining == 0 and reset_in > 0:
+            # Nothing left until the server's window resets, which restores the full limit
+            self.tokens = float(self.capacity)
+            self.updated_at = now + reset_in
+        else:
+            self.tokens = float(min(remaining, self.capacity))
+            self.updated_at = now
+
+
 class TwitterClient:
     """
     Twitter GraphQL API client.
 
     Implements OAuth 1.0a authentication based on nitter's implementation.
     Requires valid Twitter OAuth tokens from sessions.jsonl.
+
+    The underlying HTTP client is shared across all TwitterClient instances
+    and owned by the caller, so connections are kept alive between requests.
+
+    Each endpoint is gated by a token bucket sized to Twitter's per-session
+    limits and kept in sync with the x-rate-limit-* response headers, so
+    requests that would be rejected fail locally with RateLimitError
+    instead of spending a round-trip and rate budget.
     """
 
-    def __init__(self, oauth_token: str, oauth_token_secret: str):
+    def __init__(self, oauth_token: str, oauth_token_secret: str, http_client: httpx.AsyncClient):
         """
         Initialize Twitter client.
 
         Args:
             oauth_token: OAuth token from Twitter session
             oauth_token_secret: OAuth token secret from Twitter session
+            http_client: Shared HTTP client (closed by the owner, not by this client)
         """
         self.oauth_token = oauth_token
         self.oauth_token_secret = oauth_token_secret
@@ -128,29 +257,23 @@ class TwitterClient:
             signature_method="HMAC-SHA1",
         )
 
-        self.client = httpx.AsyncClient(timeout=30.0)
-
-    async def close(self):
-        """Close HTTP client."""
-        await self.client.aclose()
+        self.client = http_client
+        self._buckets = {
+            url: _TokenBucket(limit, _RATE_LIMIT_WINDOW)
+            for url, limit in _RATE_LIMITS.items()
+        }
 
-    def _get_headers(self) -> Dict[str, str]:
+    def _has_capacity(self, url: str) -> bool:
         """
-        Generate request headers for Twitter API.
+        Check whether this session may currently send a request to an endpoint.
+
+        Args:
+            url: GraphQL endpoint URL
 
-        Based on nitter's implementation from apiutils.nim.
-        Note: OAuth 1.0 authorization header is added automatically by OAuth1Auth.
+        Returns:
+            True if the endpoint's bucket has a token left
         """
-        return {
-            "authority": "api.x.com",
-            "content-type": "application/json",
-            "x-twitter-active-user": "yes",
-            "accept": "*/*",
-            "accept-encoding": "gzip",
-            "accept-language": "en-US,en;q=0.9",
-            "connection": "keep-alive",
-            "DNT": "1",
-        }
+        return self._buckets[url].has_token()
 
     async def _fetch(self, url: str, params: Dict[str, str]) -> Dict[str, Any]:
         """
@@ -167,16 +290,25 @@ class TwitterClient:
             TwitterAPIError: On API errors
             RateLimitError: On rate limit
         """
-        query_string = urlencode(params)
-        full_url = f"{url}?{query_string}"
-
-        headers = self._get_headers()
+        bucket = self._buckets[url]
+        if not bucket.try_acquire():
+            raise RateLimitError("Rate limit exceeded", 429)
 
         try:
             # Use OAuth 1.0 auth for signing the request
-            response = await self.client.get(full_url, headers=headers, auth=self.auth)
+            response = await self.client.get(url, params=params, headers=_HEADERS, auth=self.auth)
+
+            # Keep the bucket in line with the server's own count for this session
+            limit = response.headers.get("x-rate-limit-limit", "")
+            remaining = response.headers.get("x-rate-limit-remaining", "")
+            reset = response.headers.get("x-rate-limit-reset", "")
+            synced = remaining.isdigit() and reset.isdigit()
+            if synced:
+                bucket.sync(int(limit) if limit.isdigit() else None, int(remaining), int(reset) - time.time())
 
             if response.status_code == 429:
+                if not synced:
+                    bucket.drain()
                 raise RateLimitError("Rate limit exceeded", 429)
 
             if response.status_code == 503:
@@ -184,7 +316,7 @@ class TwitterClient:
 
             response.raise_for_status()
 
-            data = response.json()
+            data = orjson.loads(response.content)
 
             # Check for errors in response
             if "errors" in data:
@@ -201,7 +333,8 @@ class TwitterClient:
         except httpx.RequestError as e:
             raise TwitterAPIError(f"Request error: {str(e)}", None)
 
-    @cached(lambda: _cache, lambda username: f"twitter_client.get_user_by_screen_name.{username}")
+    # Screen names are case-insensitive, so differently-cased lookups share one entry
+    @cached(lambda: _cache, lambda username: f"twitter_client.get_user_by_screen_name.{username.lower()}")
     async def get_user_by_screen_name(self, username: str) -> Dict[str, Any]:
         """
         Get user data by username (screen name).
@@ -212,14 +345,14 @@ class TwitterClient:
         Returns:
             User data from GraphQL API
         """
-        variables = json.dumps({"screen_name": username})
+        variables = orjson.dumps({"screen_name": username}).decode()
         params = {
             "variables": variables,
-            "features": json.dumps(_GQL_FEATURES)
+            "features": _GQL_FEATURES_JSON
         }
-        return await self._fetch(_GRAPH_USER, params)
+        return await self._fetch(GRAPH_USER, params)
 
-    @cached(lambda: _cache, lambda user_id, cursor=None: f"twitter_client.get_user_tweets.{user_id}.{cursor or 'first'}")
+    # Not cached here: app.py caches the profile built from the page instead
     async def get_user_tweets(
         self,
         user_id: str,
@@ -235,22 +368,14 @@ class TwitterClient:
         Returns:
             Timeline data from GraphQL API
         """
-        variables = {
-            "rest_id": user_id,  # API expects rest_id, not userId
-            "count": 20,
-            "includePromotedContent": False,
-            "withDownvotePerspective": False,
-            "withReactionsMetadata": False,
-            "withReactionsPerspective": False,
-            "withVoice": False,
-            "withV2Timeline": True
-        }
+        # API expects rest_id, not userId
+        variables = {"rest_id": user_id, **_USER_TWEETS_VARIABLES}
 
         if cursor:
             variables["cursor"] = cursor
 
         params = {
-            "variables": json.dumps(variables),
-            "features": json.dumps(_GQL_FEATURES)
+            "variables": orjson.dumps(variables).decode(),
+            "features": _GQL_FEATURES_JSON
         }
-        return await self._fetch(_GRAPH_USER_TWEETS, params)
+        return await self._fetch(GRAPH_USER_TWEETS, params)
@@ -3,27 +3,140 @@ Twitter GraphQL response parser.
 Converts Twitter API responses to our Pydantic models.
 """
 
-from typing import Dict, Any, List, Optional
-from datetime import datetime
+import sys
+from typing import Dict, Any, Iterator, List, Optional, Sequence, Tuple
+from datetime import datetime, timezone
+from functools import lru_cache
 from .models import (
     User, Tweet, Timeline, Profile, TweetStats,
-    VerifiedType, Video, VideoVariant,
+    VerifiedType, Video, VideoVariant, VideoType,
     Gif
 )
 
+# Shared defaults for missing keys, so lookups don't allocate empty containers
+# The parser only reads from them; they must never be mutated
+_EMPTY_DICT: Dict[str, Any] = {}
+_EMPTY_LIST: Tuple[Any, ...] = ()
 
-def _parse_timestamp(timestamp_str: str) -> datetime:
-    """Parse Twitter timestamp to datetime."""
+# GraphQL __typename values of timeline instructions and entries
+_TIMELINE_PIN_ENTRY = "TimelinePinEntry"
+_TIMELINE_ADD_ENTRIES = "TimelineAddEntries"
+_TIMELINE_ITEM = "TimelineTimelineItem"
+_TIMELINE_MODULE = "TimelineTimelineModule"
+_TIMELINE_TWEET = "TimelineTweet"
+
+
+def _dig(data: Any, *keys: str, default: Any = None) -> Any:
+    """
+    Walk nested dicts along keys.
+
+    Args:
+        data: Dict to start from
+        keys: Keys to follow, outermost first
+        default: Returned when a level is missing or not a dict
+
+    Returns:
+        Value at the end of the path, or default
+    """
+    for key in keys:
+        if not isinstance(data, dict):
+            return default
+        data = data.get(key)
+        if data is None:
+            return default
+    return data
+
+
+def _to_int(value: Optional[str]) -> int:
+    """Convert a numeric ID string to int, or 0 if missing or not a number."""
+    if not value:
+        return 0
+    try:
+        return int(value)
+    except ValueError:
+        return 0
+
+
+# Format of legacy created_at fields, e.g. "Wed Oct 10 20:19:24 +0000 2018"
+_TWITTER_TIMESTAMP_FORMAT = "%a %b %d %H:%M:%S %z %Y"
+
+_MONTHS = {
+    "Jan": 1, "Feb": 2, "Mar": 3, "Apr": 4, "May": 5, "Jun": 6,
+    "Jul": 7, "Aug": 8, "Sep": 9, "Oct": 10, "Nov": 11, "Dec": 12,
+}
+
+
+def _parse_legacy_utc_timestamp(timestamp_str: str) -> Optional[datetime]:
+    """
+    Parse a legacy created_at timestamp in UTC by slicing its fixed-width fields.
+
+    Twitter always reports these in +0000, which makes strptime's general
+    format matching unnecessary.
+
+    Args:
+        timestamp_str: Timestamp like "Wed Oct 10 20:19:24 +0000 2018"
+
+    Returns:
+        Parsed datetime, or None if the string doesn't have that exact shape
+    """
+    if len(timestamp_str) != 30 or timestamp_str[20:25] != "+0000":
+        return None
+    month = _MONTHS.get(timestamp_str[4:7])
+    if month is None:
+        return None
     try:
-        # Twitter uses ISO 8601 format
-        return datetime.fromisoformat(timestamp_str.replace('Z', '+00:00'))
-    except:
-        return datetime.now()
+        return datetime(
+            int(timestamp_str[26:30]), month, int(timestamp_str[8:10]),
+            int(timestamp_str[11:13]), int(timestamp_str[14:16]), int(timestamp_str[17:19]),
+            tzinfo=timezone.utc
+        )
+    except ValueError:
+        return None
+
+
+# Authors and retweeted tweets repeat across pages, so parsed timestamps are memoized
+@lru_cache(maxsize=4096)
+def _parse_timestamp(timestamp_str: str) -> Optional[datetime]:
+    """Parse Twitter timestamp to datetime, or None if it isn't a known format."""
+    parsed = _parse_legacy_utc_timestamp(timestamp_str)
+    if parsed is not None:
+        return parsed
+    try:
+        # Legacy format with a non-UTC offset
+        return datetime.strptime(timestamp_str, _TWITTER_TIMESTAMP_FORMAT)
+    except ValueError:
+        pass
+    try:
+        # Fall back to ISO 8601 (fromisoformat accepts a trailing Z since Python 3.11)
+        parsed = datetime.fromisoformat(timestamp_str)
+    except ValueError:
+        return None
+    # Timestamps without an offset are taken as UTC, like every other parsed time
+    return parsed if parsed.tzinfo is not None else parsed.replace(tzinfo=timezone.utc)
+
+
+def _full_size_profile_image(url: str) -> str:
+    """
+    Point a profile image URL at the 400x400 variant.
+
+    Twitter returns the 48x48 "_normal" variant, e.g. ".../abc_normal.jpg".
+    Only that size suffix right before the extension is rewritten.
+
+    Args:
+        url: Profile image URL
+
+    Returns:
+        URL of the 400x400 variant, or the URL unchanged if it has no size suffix
+    """
+    head, suffix, extension = url.rpartition("_normal")
+    if not suffix or "/" in extension:
+        return url
+    return f"{head}_400x400{extension}"
 
 
 def _parse_verified_type(user_data: Dict[str, Any]) -> VerifiedType:
     """Parse user verification type."""
-    legacy = user_data.get("legacy", {})
+    legacy = user_data.get("legacy", _EMPTY_DICT)
     verified = legacy.get("verified", False)
 
     if verified:
@@ -38,9 +151,9 @@ def _parse_verified_type(user_data: Dict[str, Any]) -> VerifiedType:
     return VerifiedType.NONE
 
 
-def _parse_user(user_data: Dict[str, Any]) -> User:
+def _user_fields(user_data: Dict[str, Any]) -> Dict[str, Any]:
     """
-    Parse user data from GraphQL response.
+    Extract User fields from GraphQL user data.
 
     Based on nitter's parseUser implementation.
 
@@ -48,25 +161,26 @@ def _parse_user(user_data: Dict[str, Any]) -> User:
         user_data: User data from Twitter GraphQL API (user_result.result or user_results.result)
 
     Returns:
-        User model
+        User field values, already of the model's field types
     """
-    legacy = user_data.get("legacy", {})
+    legacy = user_data.get("legacy", _EMPTY_DICT)
     rest_id = user_data.get("rest_id", "")
+    pinned_tweet_ids = legacy.get("pinned_tweet_ids_str")
 
     # Parse join date
     created_at = legacy.get("created_at", "")
-    join_date = _parse_timestamp(created_at) if created_at else datetime.now()
+    join_date = (_parse_timestamp(created_at) if created_at else None) or datetime.now(timezone.utc)
 
-    return User(
+    return dict(
         id=rest_id,
         username=legacy.get("screen_name", ""),
         fullname=legacy.get("name", ""),
         location=legacy.get("location", ""),
         website=legacy.get("url", ""),
         bio=legacy.get("description", ""),
-        user_pic=legacy.get("profile_image_url_https", "").replace("_normal", "_400x400"),
+        user_pic=_full_size_profile_image(legacy.get("profile_image_url_https", "")),
         banner=legacy.get("profile_banner_url", ""),
-        pinned_tweet=int(legacy.get("pinned_tweet_ids_str", ["0"])[0]) if legacy.get("pinned_tweet_ids_str") else 0,
+        pinned_tweet=_to_int(pinned_tweet_ids[0]) if pinned_tweet_ids else 0,
         following=legacy.get("friends_count", 0),
         followers=legacy.get("followers_count", 0),
         tweets=legacy.get("statuses_count", 0),
@@ -79,9 +193,34 @@ def _parse_user(user_data: Dict[str, Any]) -> User:
     )
 
 
+def _parse_user(user_data: Dict[str, Any]) -> User:
+    """
+    Parse user data from GraphQL response without validation.
+
+    Used for the many users embedded in timelines; the field values are
+    already normalized by _user_fields.
+
+    Args:
+        user_data: User data from Twitter GraphQL API (user_result.result or user_results.result)
+
+    Returns:
+        User model
+    """
+    if user_data.get("__typename") == "UserUnavailable":
+        # Suspended or deactivated accounts come without legacy fields, so skip extracting them
+        return User.model_construct(
+            id=user_data.get("rest_id", ""),
+            username="",
+            fullname="",
+            suspended=True,
+            join_date=datetime.now(timezone.utc)
+        )
+    return User.model_construct(**_user_fields(user_data))
+
+
 def _parse_tweet_stats(legacy: Dict[str, Any]) -> TweetStats:
     """Parse tweet engagement statistics."""
-    return TweetStats(
+    return TweetStats.model_construct(
         replies=legacy.get("reply_count", 0),
         retweets=legacy.get("retweet_count", 0),
         likes=legacy.get("favorite_count", 0),
@@ -89,14 +228,45 @@ def _parse_tweet_stats(legacy: Dict[str, Any]) -> TweetStats:
     )
 
 
-def _parse_tweet(tweet_data: Dict[str, Any]) -> Optional[Tweet]:
+def _parse_video(media: Dict[str, Any]) -> Video:
+    """Parse a video media entity."""
+    video_info = media.get("video_info", _EMPTY_DICT)
+    return Video.model_construct(
+        duration_ms=video_info.get("duration_millis", 0),
+        thumb=media.get("media_url_https", ""),
+        variants=[
+            VideoVariant.model_construct(
+                content_type=VideoType(v.get("content_type", "video/mp4")),
+                url=v.get("url", ""),
+                bitrate=v.get("bitrate", 0)
+            )
+            for v in video_info.get("variants", _EMPTY_LIST)
+        ]
+    )
+
+
+def _parse_gif(media: Dict[str, Any]) -> Optional[Gif]:
+    """Parse an animated GIF media entity, or None if it has no variants."""
+    variants = _dig(media, "video_info", "variants")
+    if not variants:
+        return None
+    return Gif.model_construct(
+        url=variants[0].get("url", ""),
+        thumb=media.get("media_url_https", "")
+    )
+
+
+def _parse_tweet(tweet_data: Dict[str, Any], user_cache: Dict[str, User]) -> Optional[Tweet]:
     """
     Parse tweet data from GraphQL response.
 
-    Based on nitter's parseGraphTweet implementation.
+    Based on nitter's parseGraphTweet implementation. Field values are
+    normalized here, so the tweet and its nested models are built with
+    model_construct, skipping validation.
 
     Args:
         tweet_data: Tweet data from Twitter GraphQL API
+        user_cache: Users already parsed in this response, keyed by rest_id
 
     Returns:
         Tweet model or None if unavailable
@@ -108,82 +278,74 @@ def _parse_tweet(tweet_data: Dict[str, Any]) -> Optional[Tweet]:
     if not tweet_data or tweet_data.get("__typename") == "TweetUnavailable":
         return None
 
-    legacy = tweet_data.get("legacy", {})
+    legacy = tweet_data.get("legacy", _EMPTY_DICT)
     rest_id = tweet_data.get("rest_id", "0")
 
     # Parse user from core field (nitter: parseGraphUser(js{"core"}))
     # Try user_result first, then fall back to user_results
-    core = tweet_data.get("core", {})
-    user_data = core.get("user_result", {}).get("result", {})
+    user_data = _dig(tweet_data, "core", "user_result", "result")
     if not user_data:
-        user_data = core.get("user_results", {}).get("result", {})
+        user_data = _dig(tweet_data, "core", "user_results", "result")
 
     if user_data:
-        user = _parse_user(user_data)
+        # Most tweets on a timeline share an author; parse each user only once
+        user_id = user_data.get("rest_id", "")
+        user = user_cache.get(user_id) if user_id else None
+        if user is None:
+            user = _parse_user(user_data)
+            if user_id:
+                user_cache[user_id] = user
     else:
         # Fallback to minimal user
-        user = User(
+        user = User.model_construct(
             id="0",
             username="unknown",
             fullname="Unknown",
-            join_date=datetime.now()
+            join_date=datetime.now(timezone.utc)
         )
 
     # Parse timestamp
     created_at = legacy.get("created_at", "")
-    tweet_time = _parse_timestamp(created_at) if created_at else datetime.now()
+    tweet_time = (_parse_timestamp(created_at) if created_at else None) or datetime.now(timezone.utc)
 
     # Parse media
-    photos = []
-    videos = []
+    media_entities = _dig(legacy, "extended_entities", "media", default=_EMPTY_LIST)
+    photos: List[str] = []
+    videos: List[Video] = []
     gif = None
-    media_entities = legacy.get("extended_entities", {}).get("media", [])
-
-    for media in media_entities:
-        media_type = media.get("type", "")
-        if media_type == "photo":
-            photos.append(media.get("media_url_https", ""))
-        elif media_type == "video":
-            video_info = media.get("video_info", {})
-            variants = [
-                VideoVariant(
-                    content_type=v.get("content_type", "video/mp4"),
-                    url=v.get("url", ""),
-                    bitrate=v.get("bitrate", 0)
-                )
-                for v in video_info.get("variants", [])
-            ]
-            videos.append(Video(
-                duration_ms=video_info.get("duration_millis", 0),
-                thumb=media.get("media_url_https", ""),
-                variants=variants
-            ))
-        elif media_type == "animated_gif":
-            video_info = media.get("video_info", {})
-            variants = video_info.get("variants", [])
-            if variants:
-                gif = Gif(
-                    url=variants[0].get("url", ""),
-                    thumb=media.get("media_url_https", "")
-                )
+    if media_entities:
+        # Group entities by type in one pass, then build each kind separately
+        media_by_type: Dict[str, List[Dict[str, Any]]] = {"photo": [], "video": [], "animated_gif": []}
+        for m in media_entities:
+            group = media_by_type.get(m.get("type"))
+            if group is not None:
+                group.append(m)
+        photos = [m.get("media_url_https", "") for m in media_by_type["photo"]]
+        videos = [_parse_video(m) for m in media_by_type["video"]]
+        # A tweet carries at most one GIF; if there are several, the last one wins
+        gifs = [_parse_gif(m) for m in media_by_type["animated_gif"]]
+        gif = next((g for g in reversed(gifs) if g is not None), None)
 
     # Get text (full_text or extended tweet text)
     text = legacy.get("full_text", "")
     if not text:
         text = legacy.get("text", "")
 
-    return Tweet(
-        id=int(rest_id) if rest_id.isdigit() else 0,
-        thread_id=int(legacy.get("conversation_id_str", "0")) if legacy.get("conversation_id_str", "0").isdigit() else 0,
-        reply_id=int(legacy.get("in_reply_to_status_id_str", "0")) if legacy.get("in_reply_to_status_id_str") else 0,
+    reply_to = legacy.get("in_reply_to_screen_name")
+
+    return Tweet.model_construct(
+        id=_to_int(rest_id),
+        thread_id=_to_int(legacy.get("conversation_id_str")),
+        reply_id=_to_int(legacy.get("in_reply_to_status_id_str")),
         user=user,
         text=text,
         time=tweet_time,
-        reply=[legacy.get("in_reply_to_screen_name")] if legacy.get("in_reply_to_screen_name") else [],
+        reply=[reply_to] if reply_to else [],
         pinned=False,  # Will be set by the caller if needed
-        has_thread=legacy.get("self_thread", {}).get("id_str") is not None,
+        has_thread=_dig(legacy, "self_thread", "id_str") is not None,
         available=True,
-        source=legacy.get("source", ""),
+        # Only a handful of distinct client strings exist, so tweets share one copy
+        source=sys.intern(legacy.get("source", "")),
         stats=_parse_tweet_stats(legacy),
         photos=photos,
         videos=videos,
@@ -191,79 +353,115 @@ def _parse_tweet(tweet_data: Dict[str, Any]) -> Optional[Tweet]:
     )
 
 
-def _parse_timeline_tweets(timeline_data: Dict[str, Any]) -> List[Tweet]:
-    """
-    Parse timeline tweets from GraphQL response.
+def _iter_item_entry(content: Dict[str, Any], user_cache: Dict[str, User]) -> Iterator[Tweet]:
+    """Yield the tweet of a single-tweet entry (nitter: content → content → tweetResult → result)."""
+    result = _dig(content, "content", "tweetResult", "result", default=_EMPTY_DICT)
+    tweet = _parse_tweet(result, user_cache)  # User is extracted from tweet's core field
+    if tweet:
+        yield tweet
 
-    Based on nitter's parseGraphTimeline implementation.
 
-    Args:
-        timeline_data: Timeline data from Twitter GraphQL API
+def _iter_module_entry(content: Dict[str, Any], user_cache: Dict[str, User]) -> Iterator[Tweet]:
+    """Yield the tweets of a thread or conversation entry (nitter: conversationThread)."""
+    for item in content.get("items", _EMPTY_LIST):
+        item_content = _dig(item, "item", "itemContent", default=_EMPTY_DICT)
+        if item_content.get("__typename") == _TIMELINE_TWEET:
+            result = _dig(item_content, "tweetResult", "result", default=_EMPTY_DICT)
+            tweet = _parse_tweet(result, user_cache)
+            if tweet:
+                yield tweet
 
-    Returns:
-        List of tweets
+
+# Tweet-bearing timeline entries by content __typename; other entries are skipped
+_ENTRY_HANDLERS = {
+    _TIMELINE_ITEM: _iter_item_entry,
+    _TIMELINE_MODULE: _iter_module_entry,
+}
+
+
+def _iter_timeline_tweets(
+    instructions: Sequence[Dict[str, Any]],
+    user_cache: Dict[str, User],
+    cursors: Dict[str, str]
+) -> Iterator[Tweet]:
     """
-    tweets = []
+    Yield tweets from timeline instructions in order.
 
-    # Navigate to timeline instructions
-    # Actual structure: data.user_result.result.timeline_response.timeline
-    user_result = timeline_data.get("data", {}).get("user_result", {}).get("result", {})
-    timeline_response = user_result.get("timeline_response", {})
-    timeline = timeline_response.get("timeline", {})
-    instructions = timeline.get("instructions", [])
+    Pagination cursors are picked up in the same pass.
 
+    Args:
+        instructions: Timeline instructions from Twitter GraphQL API
+        user_cache: Users already parsed in this response, keyed by rest_id
+        cursors: Filled with the "top" and "bottom" cursor values found
+
+    Yields:
+        Tweets, with pinned=True for the pinned tweet
+    """
     for instruction in instructions:
         # Handle different instruction types
-        typename = instruction.get("__typename", "")
+        typename = instruction.get("__typename")
 
         # Handle pinned tweets (nitter: entry → content → content → tweetResult → result)
-        if typename == "TimelinePinEntry":
-            entry = instruction.get("entry", {})
-            content = entry.get("content", {})
-            tweet_content = content.get("content", {})
-            tweet_result = tweet_content.get("tweetResult", {})
-            result = tweet_result.get("result", {})
-            tweet = _parse_tweet(result)  # Don't pass user - it's in tweet's core field
+        if typename == _TIMELINE_PIN_ENTRY:
+            result = _dig(instruction, "entry", "content", "content", "tweetResult", "result", default=_EMPTY_DICT)
+            tweet = _parse_tweet(result, user_cache)  # Don't pass user - it's in tweet's core field
             if tweet:
                 tweet.pinned = True
-                tweets.append(tweet)
+                yield tweet
 
         # Handle regular entries - use __typename not type
-        elif typename == "TimelineAddEntries":
-            entries = instruction.get("entries", [])
+        elif typename == _TIMELINE_ADD_ENTRIES:
+            for entry in instruction.get("entries", _EMPTY_LIST):
+                content = entry.get("content", _EMPTY_DICT)
+
+                # Pagination cursors
+                entry_id = entry.get("entryId", "")
+                if "cursor-top" in entry_id:
+                    cursors["top"] = content.get("value", "")
+                    continue
+                if "cursor-bottom" in entry_id:
+                    cursors["bottom"] = content.get("value", "")
+                    continue
 
-            for entry in entries:
-                content = entry.get("content", {})
                 # Use __typename instead of entryType
-                content_typename = content.get("__typename", "")
+                handler = _ENTRY_HANDLERS.get(content.get("__typename"))
+                if handler is not None:
+                    yield from handler(content, user_cache)
 
-                if content_typename == "TimelineTimelineItem":
-                    # Single tweet (nitter: content → content → tweetResult → result)
-                    tweet_content = content.get("content", {})
-                    tweet_result = tweet_content.get("tweetResult", {})
-                    result = tweet_result.get("result", {})
 
-                    tweet = _parse_tweet(result)  # User is extracted from tweet's core field
-                    if tweet:
-                        tweets.append(tweet)
+def _get_instructions(user_result: Optional[Dict[str, Any]]) -> Sequence[Dict[str, Any]]:
+    """
+    Get the timeline instructions of a user result.
 
-                elif content_typename == "TimelineTimelineModule":
-                    # Thread or conversation (nitter handles these as conversationThread)
-                    items = content.get("items", [])
-                    for item in items:
-                        item_content = item.get("item", {}).get("itemContent", {})
-                        if item_content.get("__typename") == "TimelineTweet":
-                            tweet_result = item_content.get("tweetResult", {})
-                            result = tweet_result.get("result", {})
-                            tweet = _parse_tweet(result)
-                            if tweet:
-                                tweets.append(tweet)
+    Args:
+        user_result: data.user_result.result of a UserWithProfileTweets response
+
+    Returns:
+        Instructions at timeline_response.timeline.instructions, or an empty tuple
+    """
+    # Well-formed responses have every level, so index directly and only pay on malformed ones
+    try:
+        return user_result["timeline_response"]["timeline"]["instructions"] or _EMPTY_LIST
+    except (KeyError, TypeError):
+        return _EMPTY_LIST
 
-                # Skip cursor entries - they're handled separately for pagination
-                elif content_typename == "TimelineTimelineCursor":
-                    pass
 
-    return tweets
+def _get_user_result(graphql_response: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """
+    Get the user result of a GraphQL response.
+
+    The actual response structure is data.user_result.result (not data.user.result).
+
+    Args:
+        graphql_response: Full GraphQL response
+
+    Returns:
+        User result, or None if the response doesn't have one
+    """
+    try:
+        return graphql_response["data"]["user_result"]["result"]
+    except (KeyError, TypeError):
+        return None
 
 
 def parse_user_from_graphql(graphql_response: Dict[str, Any]) -> Optional[User]:
@@ -276,56 +474,38 @@ def parse_user_from_graphql(graphql_response: Dict[str, Any]) -> Optional[User]:
     Returns:
         User model or None
     """
-    # The actual response structure is data.user_result.result (not data.user.result)
-    user_data = graphql_response.get("data", {}).get("user_result", {}).get("result", {})
+    user_data = _get_user_result(graphql_response)
     if not user_data:
         return None
 
-    return _parse_user(user_data)
+    # A single user per response, so it goes through full validation
+    return User(**_user_fields(user_data))
 
 
-def _parse_timeline_from_graphql(graphql_response: Dict[str, Any]) -> Timeline:
+def _parse_timeline(instructions: Sequence[Dict[str, Any]], user_cache: Dict[str, User]) -> Timeline:
     """
-    Parse complete timeline from GraphQL response.
+    Parse complete timeline from timeline instructions.
+
+    Based on nitter's parseGraphTimeline implementation.
 
     Args:
-        graphql_response: Full GraphQL response
+        instructions: Timeline instructions from Twitter GraphQL API
+        user_cache: Users already parsed in this response, keyed by rest_id
 
     Returns:
         Timeline model
     """
-    tweets = _parse_timeline_tweets(graphql_response)
+    cursors: Dict[str, str] = {}
+    tweets = list(_iter_timeline_tweets(instructions, user_cache, cursors))
 
     # Group tweets into nested lists (nitter groups related tweets together for threads)
     # Currently wrapping each tweet individually; could be enhanced to group thread tweets
     content = [[tweet] for tweet in tweets]
 
-    # Extract pagination cursors
-    user_result = graphql_response.get("data", {}).get("user_result", {}).get("result", {})
-    timeline_response = user_result.get("timeline_response", {})
-    timeline = timeline_response.get("timeline", {})
-    instructions = timeline.get("instructions", [])
-
-    top_cursor = ""
-    bottom_cursor = ""
-
-    for instruction in instructions:
-        # Use __typename instead of type
-        if instruction.get("__typename") == "TimelineAddEntries":
-            entries = instruction.get("entries", [])
-            for entry in entries:
-                entry_id = entry.get("entryId", "")
-                if "cursor-top" in entry_id:
-                    content_item = entry.get("content", {})
-                    top_cursor = content_item.get("value", "")
-                elif "cursor-bottom" in entry_id:
-                    content_item = entry.get("content", {})
-                    bottom_cursor = content_item.get("value", "")
-
     return Timeline(
         content=content,
-        top=top_cursor,
-        bottom=bottom_cursor,
+        top=cursors.get("top", ""),
+        bottom=cursors.get("bottom", ""),
         beginning=len(tweets) == 0
     )
 
@@ -341,12 +521,17 @@ def parse_profile_from_graphql(graphql_response: Dict[str, Any]) -> Profile:
         Profile model
     """
     # Parse user from tweets response
-    user_result = graphql_response.get("data", {}).get("user_result", {}).get("result", {})
+    # Actual structure: data.user_result.result, with the timeline under timeline_response.timeline
+    user_result = _get_user_result(graphql_response)
     user = _parse_user(user_result) if user_result else None
 
     # Parse timeline (user will be extracted from each tweet's core field)
+    # The profile owner authors most tweets, so their tweets reuse the user parsed above,
+    # but only if the root result carries the user's legacy fields; otherwise each tweet's
+    # own core user is parsed instead of an empty placeholder
     # Pinned tweets are handled in the timeline with pinned=True flag
-    timeline = _parse_timeline_from_graphql(graphql_response)
+    user_cache = {user.id: user} if user and user.id and user.username else {}
+    timeline = _parse_timeline(_get_instructions(user_result), user_cache)
 
     # Extract pinned tweet from timeline if present
     pinned = None
@@ -364,7 +549,7 @@ def parse_profile_from_graphql(graphql_response: Dict[str, Any]) -> Profile:
             id="0",
             username="unknown",
             fullname="Unknown",
-            join_date=datetime.now()
+            join_date=datetime.now(timezone.utc)
         )
 
     return Profile(